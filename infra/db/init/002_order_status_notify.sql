@@ -0,0 +1,36 @@
+-- ============================================================
+-- Order Service - Order Status Notifications
+-- ============================================================
+-- Publishes a NOTIFY on the 'order_status' channel whenever an
+-- order's status changes. The Order Service keeps one LISTEN
+-- connection per worker and fans these notifications out to SSE /
+-- long-poll subscribers of GET /api/v1/orders/{id}/events.
+--
+-- Inserts are not notified: nobody can subscribe to an order before
+-- it exists (the endpoint returns 404), and every NOTIFY goes through
+-- Postgres' single notification queue at commit.
+--
+-- Payload (JSON): {"order_id": <int>, "status": <text>}
+-- The channel name must match ORDER_EVENTS_CHANNEL.
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION notify_order_status() RETURNS trigger AS $$
+BEGIN
+    IF OLD.status IS NOT DISTINCT FROM NEW.status THEN
+        RETURN NEW;
+    END IF;
+
+    PERFORM pg_notify(
+        'order_status',
+        json_build_object('order_id', NEW.id, 'status', NEW.status)::text
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS orders_status_notify ON orders;
+
+CREATE TRIGGER orders_status_notify
+    AFTER UPDATE OF status ON orders
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_order_status();
@@ -0,0 +1,51 @@
+"""
+Gunicorn configuration for multi-process serving.
+
+Usage:
+    gunicorn --config gunicorn.conf.py
+
+The app is imported once in the master (preload) and forked into
+`ORDER_WEB_WORKERS` uvicorn workers (or `-w`, which takes precedence; the
+count gunicorn runs is what workers size their pools from). Database pools
+and the order event listener are per worker: anything inherited across fork
+is set aside unused (see src/config/database.py) and each worker opens its
+own connections, sized so
+that all workers together stay within `ORDER_DB_CONNECTION_BUDGET`, even
+while old and new workers overlap during a reload.
+
+Restarts:
+- `kill -HUP <master pid>` starts fresh workers, then gracefully stops the
+  old ones after they finish in-flight requests. Pools are sized for this
+  overlap (each worker gets budget // (2 * workers) connections).
+- `ORDER_WEB_MAX_REQUESTS` (+ `_JITTER`) recycles workers one at a time.
+"""
+from src.config.database import get_pool_size
+from src.config.settings import settings
+
+wsgi_app = "src.main:app"
+worker_class = "uvicorn_worker.UvicornWorker"
+
+bind = settings.web_bind
+workers = settings.web_workers
+preload_app = True
+
+graceful_timeout = settings.web_graceful_timeout
+max_requests = settings.web_max_requests
+max_requests_jitter = settings.web_max_requests_jitter
+
+
+def on_starting(server):
+    """Fail fast if the connection budget cannot cover every worker."""
+    minconn, maxconn = get_pool_size(server.cfg.workers)
+    server.log.info(
+        f"Starting {server.cfg.workers} workers, database pool {minconn}-{maxconn} "
+        f"connections each (budget {settings.db_connection_budget})"
+    )
+
+
+def pre_fork(server, worker):
+    """
+    Hand the worker count gunicorn actually runs (-w, config, or a reload)
+    to the worker, which sizes its pool from settings.web_workers.
+    """
+    settings.web_workers = server.cfg.workers
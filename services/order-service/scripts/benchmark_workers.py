@@ -0,0 +1,124 @@
+"""
+Throughput benchmark for the multi-worker serving mode.
+
+Starts the service under gunicorn (gunicorn.conf.py) with 1..N workers,
+drives GET /api/v1/orders/{id} with concurrent clients for a fixed time and
+prints requests/second and latency percentiles per worker count.
+
+Usage (from services/order-service, with the database running):
+    python -m scripts.benchmark_workers --max-workers 4 --duration 10
+
+Note the client runs on the same host and competes for CPU with the
+workers; compare runs on the same machine rather than reading absolute
+numbers.
+"""
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import httpx
+
+
+async def _wait_until_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/ready")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"Service at {base_url} did not become ready")
+
+
+async def _run_load(base_url: str, duration: float, concurrency: int) -> tuple[int, list[float]]:
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        response = await client.post(
+            "/api/v1/orders", json={"user_id": 1, "product_id": 1, "quantity": 1}
+        )
+        response.raise_for_status()
+        path = f"/api/v1/orders/{response.json()['order_id']}"
+
+        latencies: list[float] = []
+        errors = 0
+        deadline = time.monotonic() + duration
+
+        async def client_loop():
+            nonlocal errors
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                if response.status_code == 200:
+                    latencies.append(time.perf_counter() - started)
+                else:
+                    errors += 1
+
+        await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+        return errors, latencies
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def _format_ms(seconds: float | None) -> str:
+    return "n/a" if seconds is None else f"{seconds * 1000:.2f}"
+
+
+def benchmark(workers: int, port: int, duration: float, concurrency: int) -> dict:
+    """Run one load test against a fresh gunicorn master with `workers` workers."""
+    env = dict(os.environ, ORDER_WEB_WORKERS=str(workers), ORDER_WEB_BIND=f"127.0.0.1:{port}")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "--config", "gunicorn.conf.py", "--log-level", "warning"],
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        asyncio.run(_wait_until_ready(base_url))
+        errors, latencies = asyncio.run(_run_load(base_url, duration, concurrency))
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=60)
+
+    return {
+        "workers": workers,
+        "rps": len(latencies) / duration,
+        "p50": _percentile(latencies, 0.50),
+        "p99": _percentile(latencies, 0.99),
+        "errors": errors,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of load per worker count")
+    parser.add_argument("--concurrency", type=int, default=32, help="concurrent client connections")
+    parser.add_argument("--port", type=int, default=8100)
+    args = parser.parse_args()
+
+    print(f"{'workers':>7} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>6}")
+    for workers in range(1, args.max_workers + 1):
+        result = benchmark(workers, args.port, args.duration, args.concurrency)
+        print(
+            f"{result['workers']:>7} {result['rps']:>9.1f} {_format_ms(result['p50']):>8} "
+            f"{_format_ms(result['p99']):>8} {result['errors']:>6}",
+            flush=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
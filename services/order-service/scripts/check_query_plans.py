@@ -0,0 +1,212 @@
+"""
+Query-plan regression harness for the orders repository.
+
+Grows the orders table through a series of scales with synthetic data (see
+scripts/seed_orders.py) and, at each scale, captures
+EXPLAIN (ANALYZE, BUFFERS) for every query in
+src/repository/orders_repository.py. It fails (exit code 1) if:
+- a query that used an index on a table at a smaller scale switches to a
+  sequential scan of that table at a larger one, or
+- a query's buffer count (shared hit + read) grows past
+  --max-buffer-growth times its count at the smallest scale.
+
+Usage (from services/order-service, against a disposable local database):
+    python -m scripts.check_query_plans --scales 10000,1000000,100000000 --truncate
+
+Statements that modify data run inside a transaction that is rolled back.
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+from dataclasses import dataclass, field
+from typing import Callable
+
+from psycopg2.extensions import connection
+
+from scripts.seed_orders import connect, count_orders, generate_orders, seed_orders
+from src.repository.orders_repository import INSERT_ORDER_QUERY, SELECT_ORDER_BY_ID_QUERY
+
+INDEX_SCAN_NODES = {"Index Scan", "Index Only Scan", "Bitmap Heap Scan"}
+
+
+@dataclass
+class QueryCheck:
+    """A repository query and how to draw realistic parameters for it."""
+
+    name: str
+    sql: str
+    params: Callable[[random.Random, int], tuple]
+
+
+def _new_order_params(rng: random.Random, max_id: int) -> tuple:
+    user_id, product_id, quantity, _, _ = next(generate_orders(1, rng, 100_000, 10_000, 1))
+    return user_id, product_id, quantity, "created"
+
+
+QUERY_CHECKS = [
+    QueryCheck("get_order_by_id", SELECT_ORDER_BY_ID_QUERY, lambda rng, max_id: (rng.randint(1, max_id),)),
+    QueryCheck("create_order", INSERT_ORDER_QUERY, _new_order_params),
+]
+
+
+@dataclass
+class PlanSample:
+    """Summary of one query's plans at one scale."""
+
+    query: str
+    rows: int
+    # (node type, relation) for every scan node in the plan
+    scans: set[tuple[str, str]] = field(default_factory=set)
+    buffers: float = 0.0
+    execution_ms: float = 0.0
+    plan: dict = field(default_factory=dict)
+
+
+def collect_scans(node: dict) -> set[tuple[str, str]]:
+    """Return (node type, relation) for every scan node in a JSON plan tree."""
+    scans = set()
+    if "Relation Name" in node and "Scan" in node["Node Type"]:
+        scans.add((node["Node Type"], node["Relation Name"]))
+    for child in node.get("Plans", ()):
+        scans |= collect_scans(child)
+    return scans
+
+
+def capture_plan(conn: connection, check: QueryCheck, rng: random.Random, rows: int, samples: int) -> PlanSample:
+    """
+    Run EXPLAIN (ANALYZE, BUFFERS) for a query several times with fresh parameters.
+
+    Buffers and execution time are the median over samples; scans are the
+    union of every sample's scan nodes.
+    """
+    sample = PlanSample(query=check.name, rows=rows)
+    buffers, timings = [], []
+
+    with conn.cursor() as cur:
+        cur.execute("SELECT coalesce(max(id), 1) FROM orders")
+        max_id = cur.fetchone()[0]
+
+        for _ in range(samples):
+            cur.execute(
+                "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + check.sql,
+                check.params(rng, max_id),
+            )
+            result = cur.fetchone()[0][0]
+            conn.rollback()
+
+            plan = result["Plan"]
+            sample.scans |= collect_scans(plan)
+            sample.plan = result
+            buffers.append(plan.get("Shared Hit Blocks", 0) + plan.get("Shared Read Blocks", 0))
+            timings.append(result["Execution Time"])
+
+    sample.buffers = statistics.median(buffers)
+    sample.execution_ms = statistics.median(timings)
+    return sample
+
+
+def find_regressions(samples_by_scale: list[list[PlanSample]], max_buffer_growth: float) -> list[str]:
+    """
+    Compare plan samples across increasing scales.
+
+    Args:
+        samples_by_scale: One list of PlanSample per scale, smallest first
+        max_buffer_growth: Allowed ratio of buffers to the smallest scale
+
+    Returns:
+        list[str]: Human-readable description of each regression.
+    """
+    regressions = []
+    baseline = {sample.query: sample for sample in samples_by_scale[0]}
+    indexed: dict[str, set[str]] = {}
+
+    for samples in samples_by_scale:
+        for sample in samples:
+            seen = indexed.setdefault(sample.query, set())
+            for node_type, relation in sorted(sample.scans):
+                if node_type == "Seq Scan" and relation in seen:
+                    regressions.append(
+                        f"{sample.query}: index scan on {relation} became a sequential "
+                        f"scan at {sample.rows} rows"
+                    )
+            seen |= {relation for node_type, relation in sample.scans if node_type in INDEX_SCAN_NODES}
+
+            limit = max(baseline[sample.query].buffers, 1) * max_buffer_growth
+            if sample.buffers > limit:
+                regressions.append(
+                    f"{sample.query}: {sample.buffers:g} buffers at {sample.rows} rows, "
+                    f"over {limit:g} ({max_buffer_growth:g}x the "
+                    f"{baseline[sample.query].rows}-row baseline)"
+                )
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--scales", default="10000,100000,1000000",
+        help="comma-separated row counts to grow the table through",
+    )
+    parser.add_argument("--max-buffer-growth", type=float, default=2.0)
+    parser.add_argument("--samples", type=int, default=5, help="EXPLAIN runs per query per scale")
+    parser.add_argument("--truncate", action="store_true", help="empty the orders table first")
+    parser.add_argument("--report", help="write every captured plan to this JSON file")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    scales = sorted(int(scale) for scale in args.scales.split(","))
+    rng = random.Random(args.seed)
+    conn = connect()
+
+    try:
+        if args.truncate:
+            with conn.cursor() as cur:
+                cur.execute("TRUNCATE orders RESTART IDENTITY")
+            conn.commit()
+
+        rows = count_orders(conn)
+        if rows > scales[0]:
+            parser.error(f"orders already has {rows} rows, above the smallest scale; use --truncate")
+
+        samples_by_scale = []
+        print(f"{'rows':>12} {'query':<18} {'buffers':>8} {'ms':>8}  scans")
+        for scale in scales:
+            if scale > rows:
+                seed_orders(conn, scale - rows, rng)
+                rows = scale
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute("VACUUM ANALYZE orders")
+            conn.autocommit = False
+
+            samples = [capture_plan(conn, check, rng, rows, args.samples) for check in QUERY_CHECKS]
+            samples_by_scale.append(samples)
+            for sample in samples:
+                scans = ", ".join(f"{node} on {relation}" for node, relation in sorted(sample.scans)) or "-"
+                print(f"{rows:>12} {sample.query:<18} {sample.buffers:>8g} {sample.execution_ms:>8.3f}  {scans}")
+    finally:
+        conn.close()
+
+    if args.report:
+        with open(args.report, "w") as report:
+            json.dump(
+                [
+                    {"rows": sample.rows, "query": sample.query, "buffers": sample.buffers, "plan": sample.plan}
+                    for samples in samples_by_scale
+                    for sample in samples
+                ],
+                report,
+                indent=2,
+            )
+
+    regressions = find_regressions(samples_by_scale, args.max_buffer_growth)
+    for regression in regressions:
+        print(f"REGRESSION: {regression}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
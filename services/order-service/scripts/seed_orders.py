@@ -0,0 +1,221 @@
+"""
+Synthetic order data generator.
+
+Seeds the configured database (ORDER_DB_* settings) with realistic orders
+using COPY:
+- user_id and product_id follow a power-law skew (a few heavy buyers and
+  best-selling products, a long tail of rare ones)
+- created_at is spread over a time window, weighted towards recent days
+- status depends on age: recent orders are mostly created/paid, older ones
+  mostly delivered, with a share of cancellations
+- quantity is mostly 1-2 with a short tail
+
+Usage (from services/order-service):
+    python -m scripts.seed_orders --rows 1000000 --users 100000 --products 10000
+
+The order status NOTIFY trigger is disabled while loading so seeding does
+not flood listeners; each batch is committed separately.
+"""
+import argparse
+import io
+import logging
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Iterator
+
+import psycopg2
+from psycopg2.extensions import connection
+
+from src.config.database import get_connection_string
+from src.config.settings import AppEnv, settings
+
+logger = logging.getLogger(__name__)
+
+# Status mix for orders older than RECENT_DAYS, and for recent ones
+SETTLED_STATUS_WEIGHTS = {"delivered": 0.82, "shipped": 0.06, "cancelled": 0.09, "paid": 0.03}
+RECENT_STATUS_WEIGHTS = {"created": 0.45, "paid": 0.35, "shipped": 0.15, "cancelled": 0.05}
+RECENT_DAYS = 3
+
+COPY_ORDERS_QUERY = (
+    "COPY orders (user_id, product_id, quantity, status, created_at) FROM STDIN"
+)
+
+
+def _skewed_id(rng: random.Random, population: int, skew: float) -> int:
+    """Draw an ID in [1, population]; higher skew concentrates on low IDs."""
+    return int(population * rng.random() ** skew) + 1
+
+
+def generate_orders(
+    count: int,
+    rng: random.Random,
+    users: int,
+    products: int,
+    days: int,
+    user_skew: float = 3.0,
+    product_skew: float = 4.0,
+    now: datetime | None = None,
+) -> Iterator[tuple[int, int, int, str, datetime]]:
+    """
+    Yield synthetic order rows.
+
+    Args:
+        count: Number of rows to generate
+        rng: Random source (seed it for reproducible data)
+        users: Size of the user ID population
+        products: Size of the product ID population
+        days: Width of the created_at window ending at `now`
+        user_skew: Power-law exponent for user_id (1.0 = uniform)
+        product_skew: Power-law exponent for product_id (1.0 = uniform)
+        now: End of the time window (defaults to the current time)
+
+    Yields:
+        (user_id, product_id, quantity, status, created_at)
+    """
+    now = now or datetime.now()
+    settled = (list(SETTLED_STATUS_WEIGHTS), list(SETTLED_STATUS_WEIGHTS.values()))
+    recent = (list(RECENT_STATUS_WEIGHTS), list(RECENT_STATUS_WEIGHTS.values()))
+
+    for _ in range(count):
+        # Squaring the uniform draw puts more orders in recent days
+        age_days = days * rng.random() ** 2
+        statuses, weights = recent if age_days < RECENT_DAYS else settled
+        yield (
+            _skewed_id(rng, users, user_skew),
+            _skewed_id(rng, products, product_skew),
+            min(int(rng.expovariate(0.9)) + 1, 20),
+            rng.choices(statuses, weights)[0],
+            now - timedelta(days=age_days),
+        )
+
+
+class _CopyStream(io.TextIOBase):
+    """File-like adapter feeding generated rows to COPY in text format."""
+
+    def __init__(self, rows: Iterator[tuple]):
+        self._rows = rows
+        self._buffer = ""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            lines = []
+            for row in self._rows:
+                lines.append("\t".join(str(value) for value in row))
+                if len(lines) >= 1000:
+                    break
+            if not lines:
+                break
+            self._buffer += "\n".join(lines) + "\n"
+
+        if size < 0:
+            chunk, self._buffer = self._buffer, ""
+        else:
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+def seed_orders(
+    conn: connection,
+    rows: int,
+    rng: random.Random,
+    users: int = 100_000,
+    products: int = 10_000,
+    days: int = 365,
+    batch_size: int = 1_000_000,
+    commit: bool = True,
+) -> int:
+    """
+    Load synthetic orders with COPY, one transaction per batch.
+
+    Args:
+        conn: Database connection (not in autocommit mode)
+        rows: Number of orders to insert
+        rng: Random source
+        users: Size of the user ID population
+        products: Size of the product ID population
+        days: Width of the created_at window
+        batch_size: Rows per COPY / transaction
+        commit: Commit after each batch; if False everything stays in the
+            caller's open transaction
+
+    Returns:
+        int: Number of rows inserted.
+    """
+    inserted = 0
+    now = datetime.now()
+
+    while inserted < rows:
+        batch = min(batch_size, rows - inserted)
+        started = time.perf_counter()
+
+        with conn.cursor() as cur:
+            cur.execute("ALTER TABLE orders DISABLE TRIGGER orders_status_notify")
+            cur.copy_expert(
+                COPY_ORDERS_QUERY,
+                _CopyStream(generate_orders(batch, rng, users, products, days, now=now)),
+            )
+            cur.execute("ALTER TABLE orders ENABLE TRIGGER orders_status_notify")
+        if commit:
+            conn.commit()
+
+        inserted += batch
+        logger.info(
+            f"Seeded {inserted}/{rows} orders ({batch / (time.perf_counter() - started):.0f} rows/s)",
+            extra={"service_name": "order-service"}
+        )
+
+    return inserted
+
+
+def count_orders(conn: connection) -> int:
+    """Return the current number of rows in the orders table."""
+    with conn.cursor() as cur:
+        cur.execute("SELECT count(*) FROM orders")
+        count = cur.fetchone()[0]
+    conn.rollback()
+    return count
+
+
+def connect() -> connection:
+    """
+    Open a connection for seeding, refusing to touch production.
+
+    Raises:
+        RuntimeError: If ORDER_APP_ENV is prod
+    """
+    if settings.app_env == AppEnv.prod:
+        raise RuntimeError("Refusing to seed synthetic data with ORDER_APP_ENV=prod")
+    return psycopg2.connect(get_connection_string())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, required=True, help="orders to insert")
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--products", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=365, help="time window for created_at")
+    parser.add_argument("--batch-size", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    conn = connect()
+    try:
+        seed_orders(
+            conn, args.rows, random.Random(args.seed),
+            users=args.users, products=args.products, days=args.days, batch_size=args.batch_size,
+        )
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute("ANALYZE orders")
+        print(f"orders table now has {count_orders(conn)} rows")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
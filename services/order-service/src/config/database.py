@@ -3,10 +3,15 @@ Database connection pool management.
 
 Provides a connection pool and context manager for database operations.
 Connections are reused from the pool, not created on-demand.
+
+The pool is per process: it is sized from the global connection budget
+divided across workers, and forked children set the inherited pool aside
+(never using or closing it) so each worker opens its own connections.
 """
 import logging
+import os
 from contextlib import contextmanager
-from typing import Generator
+from typing import Callable, Generator, Optional
 
 from psycopg2 import pool
 from psycopg2.extensions import connection
@@ -15,24 +20,72 @@ from src.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
-# Global connection pool instance
-_db_pool: pool.SimpleConnectionPool | None = None
+# Global connection pool instance (per process)
+_db_pool: pool.ThreadedConnectionPool | None = None
+
+# Pools inherited from a parent process, kept alive so they are never closed here
+_inherited_pools: list[pool.ThreadedConnectionPool] = []
 
 
-def get_db_pool() -> pool.SimpleConnectionPool:
+def get_connection_string() -> str:
+    """
+    Build the PostgreSQL DSN from application settings.
+    
+    Returns:
+        str: libpq connection URI for the configured database.
+    """
+    return (
+        f"postgresql://{settings.db_user}:{settings.db_password}"
+        f"@{settings.db_host}:{settings.db_port}/{settings.db_name}"
+    )
+
+
+def get_pool_size(workers: int | None = None) -> tuple[int, int]:
+    """
+    Compute this worker's pool bounds from the global connection budget.
+    
+    Every worker holds its pool plus one LISTEN connection for order events.
+    A graceful gunicorn reload (SIGHUP) starts a full set of new workers
+    before the old ones exit, so up to twice the worker count can hold
+    connections at once; the budget is split across that many workers and
+    one connection per worker is set aside for the listener.
+    
+    Args:
+        workers: Number of worker processes (defaults to settings.web_workers)
+        
+    Returns:
+        tuple[int, int]: (minconn, maxconn) for this worker's pool.
+        
+    Raises:
+        ValueError: If the budget cannot give every worker at least one
+            pooled connection plus its listener.
+    """
+    workers = workers or settings.web_workers
+    # Old and new workers overlap during a reload
+    maxconn = settings.db_connection_budget // (2 * workers) - 1
+    
+    if maxconn < 1:
+        raise ValueError(
+            f"Database connection budget of {settings.db_connection_budget} is too "
+            f"small for {workers} workers (each needs at least 2 connections, "
+            f"reserved twice to cover restarts)"
+        )
+    
+    return min(settings.db_pool_min_size, maxconn), maxconn
+
+
+def get_db_pool() -> pool.ThreadedConnectionPool:
     """
     Get or create the database connection pool.
     
     Returns:
-        SimpleConnectionPool: The database connection pool instance.
+        ThreadedConnectionPool: The database connection pool instance.
     """
     global _db_pool
     
     if _db_pool is None:
-        connection_string = (
-            f"postgresql://{settings.db_user}:{settings.db_password}"
-            f"@{settings.db_host}:{settings.db_port}/{settings.db_name}"
-        )
+        connection_string = get_connection_string()
+        minconn, maxconn = get_pool_size()
         
         logger.info(
             f"Initializing database connection pool",
@@ -41,14 +94,18 @@ def get_db_pool() -> pool.SimpleConnectionPool:
                 "db_host": settings.db_host,
                 "db_port": settings.db_port,
                 "db_name": settings.db_name,
+                "pid": os.getpid(),
+                "minconn": minconn,
+                "maxconn": maxconn,
             }
         )
         
         try:
-            _db_pool = pool.SimpleConnectionPool(
-                minconn=1,
-                maxconn=10,
-                dsn=connection_string
+            _db_pool = pool.ThreadedConnectionPool(
+                minconn=minconn,
+                maxconn=maxconn,
+                dsn=connection_string,
+                connect_timeout=settings.db_connect_timeout,
             )
             
             if _db_pool:
@@ -120,6 +177,102 @@ def get_connection() -> Generator[connection, None, None]:
             )
 
 
+def warm_up_db_pool(
+    warm_up_connection: Optional[Callable[[connection], None]] = None
+) -> int:
+    """
+    Pre-open the pool and validate every connection it keeps open.
+    
+    Each of the pool's minimum connections is checked out at once (so they
+    are distinct), validated with a round trip and optionally warmed, then
+    returned. Connections that fail validation are discarded.
+    Should be called during application startup.
+    
+    Args:
+        warm_up_connection: Optional callable run on each validated connection
+        
+    Returns:
+        int: Number of connections validated.
+        
+    Raises:
+        psycopg2.Error: If the database is unreachable or warm-up fails
+    """
+    pool_instance = get_db_pool()
+    minconn, _ = get_pool_size()
+    conns = []
+    
+    try:
+        for _ in range(max(minconn, 1)):
+            conns.append(pool_instance.getconn())
+        
+        for conn in conns:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            if warm_up_connection:
+                warm_up_connection(conn)
+            conn.rollback()
+    except Exception:
+        for conn in conns:
+            pool_instance.putconn(conn, close=True)
+        raise
+    
+    for conn in conns:
+        pool_instance.putconn(conn)
+    
+    logger.info(
+        "Database connection pool warmed up",
+        extra={"service_name": "order-service", "connections": len(conns)}
+    )
+    return len(conns)
+
+
+def ping_database() -> None:
+    """
+    Check that a pooled connection can reach the database.
+    
+    A pool with every connection checked out counts as reachable without a
+    round trip: those connections are serving queries, and failing here
+    would take a busy worker out of rotation.
+    
+    Raises:
+        Exception: If the pool is empty or the query fails
+    """
+    pool_instance = get_db_pool()
+    try:
+        conn = pool_instance.getconn()
+    except pool.PoolError:
+        if pool_instance._used:
+            return
+        raise
+    
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+    finally:
+        pool_instance.putconn(conn)
+
+
+def get_pool_status() -> dict:
+    """
+    Describe this worker's connection pool.
+    
+    Returns:
+        dict: Pool bounds and current in-use / idle counts, or
+            {"initialized": False} before the pool is created.
+    """
+    if _db_pool is None:
+        return {"initialized": False}
+    
+    return {
+        "initialized": True,
+        "min": _db_pool.minconn,
+        "max": _db_pool.maxconn,
+        "in_use": len(_db_pool._used),
+        "idle": len(_db_pool._pool),
+    }
+
+
 def close_db_pool():
     """
     Close all connections in the pool.
@@ -135,3 +288,21 @@ def close_db_pool():
             extra={"service_name": "order-service"}
         )
 
+
+def _discard_db_pool_after_fork():
+    """
+    Set aside a pool inherited from the parent process.
+    
+    The child must not use or close the parent's sockets: closing them
+    sends a Terminate message over the shared socket and ends the parent's
+    sessions. The inherited pool is kept referenced for the life of the
+    child, out of reach of close_db_pool() and of garbage collection, and
+    the child lazily creates its own.
+    """
+    global _db_pool
+    if _db_pool is not None:
+        _inherited_pools.append(_db_pool)
+    _db_pool = None
+
+
+os.register_at_fork(after_in_child=_discard_db_pool_after_fork)
@@ -1,5 +1,6 @@
 from enum import Enum
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -44,6 +45,48 @@ class Settings(BaseSettings):
     db_user: str = "postgres"
     db_password: str = "postgres"
 
+    # Total connections this service may hold against the database, shared
+    # by every worker process (pools plus one event listener per worker).
+    # Keep it below the server's max_connections.
+    db_connection_budget: int = Field(default=90, gt=0)
+    # Connections each worker pre-opens in its pool.
+    db_pool_min_size: int = Field(default=1, ge=0)
+    # Seconds to wait when opening a database connection before giving up.
+    db_connect_timeout: int = Field(default=5, gt=0)
+
+    # Startup
+    # Pre-open, validate and warm pooled connections before serving traffic.
+    startup_warm_up: bool = True
+    # Target time from process start to ready; exceeding it logs a warning.
+    startup_budget_seconds: float = Field(default=5.0, gt=0)
+
+    # Multi-process serving (gunicorn, see gunicorn.conf.py)
+    web_bind: str = "0.0.0.0:8000"
+    web_workers: int = Field(default=1, gt=0)
+    # Seconds a worker gets to finish in-flight requests on restart/shutdown.
+    web_graceful_timeout: int = Field(default=30, gt=0)
+    # Recycle a worker after this many requests (0 disables); jitter staggers
+    # the restarts so workers roll one at a time instead of all at once.
+    web_max_requests: int = Field(default=0, ge=0)
+    web_max_requests_jitter: int = Field(default=0, ge=0)
+
+    # Order status event streaming (SSE / long-poll)
+    # Postgres NOTIFY channel written to by the orders table trigger.
+    events_channel: str = "order_status"
+    # Maximum concurrent event subscribers per worker process.
+    events_max_subscribers: int = Field(default=1000, gt=0)
+    # Retry-After (seconds) sent with the 503 when the subscriber limit is reached.
+    events_retry_after: int = Field(default=5, gt=0)
+    # Seconds between SSE heartbeat comments on an idle stream.
+    events_heartbeat_interval: float = Field(default=15.0, gt=0)
+    # Buffered events per subscriber before it is treated as a slow consumer.
+    events_queue_size: int = Field(default=16, gt=0)
+    # What to do with a slow consumer whose buffer is full:
+    # "drop_oldest" discards its oldest buffered event, "disconnect" ends its stream.
+    events_slow_consumer_policy: Literal["drop_oldest", "disconnect"] = "drop_oldest"
+    # Upper bound (seconds) a long-poll request may wait for a status change.
+    events_long_poll_timeout: float = Field(default=30.0, gt=0)
+
     # Configuration for the Settings model itself.
     # env_prefix automatically prepends "ORDER_" to all defined env variables.
     model_config = SettingsConfigDict(
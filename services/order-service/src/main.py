@@ -1,8 +1,63 @@
-from fastapi import FastAPI
+import time
+
+# Measured first so the import cost of the app itself shows up in the logs
+_import_started = time.perf_counter()
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, status
+from fastapi.responses import JSONResponse
+from src.config.database import close_db_pool, get_pool_status, ping_database, warm_up_db_pool
 from src.config.settings import settings
+from src.repository.orders_repository import warm_up_connection
 from src.routes import orders
+from src.services.order_events import close_event_broker, get_event_broker
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    startup_started = time.perf_counter()
+
+    if settings.startup_warm_up:
+        try:
+            await asyncio.to_thread(warm_up_db_pool, warm_up_connection)
+            await get_event_broker().start()
+        except Exception as e:
+            # Keep serving liveness; /ready reports 503 until the database is reachable
+            logger.warning(
+                f"Startup warm-up failed, service is not ready: {e}",
+                extra={"service_name": "order-service"},
+            )
+
+    startup_seconds = time.perf_counter() - startup_started
+    total_seconds = time.perf_counter() - _process_started
+    logger.info(
+        f"Startup complete in {total_seconds:.3f}s (warm-up {startup_seconds:.3f}s)",
+        extra={
+            "service_name": "order-service",
+            "import_seconds": round(_import_seconds, 3),
+            # Preloaded: imported once in the gunicorn master, not counted above
+            "preloaded": _preloaded,
+        },
+    )
+    if total_seconds > settings.startup_budget_seconds:
+        logger.warning(
+            f"Startup took {total_seconds:.3f}s, over the "
+            f"{settings.startup_budget_seconds:.1f}s budget",
+            extra={"service_name": "order-service"},
+        )
+
+    yield
+    await close_event_broker()
+    close_db_pool()
 
-app = FastAPI(title=settings.app_name)
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
 # Register routers
 app.include_router(orders.router)
@@ -11,3 +66,32 @@ app.include_router(orders.router)
 async def health_check():
     return {"status": "ok"}
 
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness: 200 when the database is reachable through the pool (or the pool is fully in use)."""
+    try:
+        await asyncio.to_thread(ping_database)
+    except Exception as e:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "unavailable", "reason": str(e), "pool": get_pool_status()},
+        )
+    return {"status": "ready", "pool": get_pool_status()}
+
+
+_import_seconds = time.perf_counter() - _import_started
+
+# Start of this process's startup, reset in forked workers (gunicorn preload_app)
+_process_started = _import_started
+_preloaded = False
+
+
+def _reset_startup_clock_after_fork():
+    """Time a forked worker's startup from the fork, not from the master's import."""
+    global _process_started, _preloaded
+    _process_started = time.perf_counter()
+    _preloaded = True
+
+
+os.register_at_fork(after_in_child=_reset_startup_clock_after_fork)
@@ -5,6 +5,7 @@ from src.models.order import (
     OrderCreate,
     OrderInDB,
     OrderResponse,
+    OrderStatusEvent,
 )
 
 __all__ = [
@@ -12,5 +13,6 @@ __all__ = [
     "OrderCreate",
     "OrderInDB",
     "OrderResponse",
+    "OrderStatusEvent",
 ]
 
@@ -6,6 +6,7 @@ Model hierarchy:
 - OrderCreate: Input model for creating orders
 - OrderInDB: Full model representing database row
 - OrderResponse: Output model for API responses
+- OrderStatusEvent: Status change pushed to event subscribers
 """
 from datetime import datetime
 from typing import Optional
@@ -59,3 +60,9 @@ class OrderResponse(BaseModel):
             created_at=order.created_at,
         )
 
+
+class OrderStatusEvent(BaseModel):
+    """Model for order status changes pushed over SSE / long-poll."""
+    
+    order_id: int = Field(..., description="Order ID")
+    status: str = Field(..., description="Order status")
@@ -9,12 +9,25 @@ from typing import Optional
 
 import psycopg2
 from psycopg2 import errors
+from psycopg2.extensions import connection
 
 from src.config.database import get_connection
 from src.models.order import OrderCreate, OrderInDB, OrderResponse
 
 logger = logging.getLogger(__name__)
 
+INSERT_ORDER_QUERY = """
+    INSERT INTO orders (user_id, product_id, quantity, status)
+    VALUES (%s, %s, %s, %s)
+    RETURNING id, user_id, product_id, quantity, status, created_at
+"""
+
+SELECT_ORDER_BY_ID_QUERY = """
+    SELECT id, user_id, product_id, quantity, status, created_at
+    FROM orders
+    WHERE id = %s
+"""
+
 
 def create_order(order: OrderCreate) -> OrderResponse:
     """
@@ -44,14 +57,8 @@ def create_order(order: OrderCreate) -> OrderResponse:
         try:
             with conn.cursor() as cur:
                 # Use RETURNING clause to get the inserted row
-                insert_query = """
-                    INSERT INTO orders (user_id, product_id, quantity, status)
-                    VALUES (%s, %s, %s, %s)
-                    RETURNING id, user_id, product_id, quantity, status, created_at
-                """
-                
                 cur.execute(
-                    insert_query,
+                    INSERT_ORDER_QUERY,
                     (order.user_id, order.product_id, order.quantity, "created")
                 )
                 
@@ -165,13 +172,7 @@ def get_order_by_id(order_id: int) -> Optional[OrderResponse]:
     with get_connection() as conn:
         try:
             with conn.cursor() as cur:
-                select_query = """
-                    SELECT id, user_id, product_id, quantity, status, created_at
-                    FROM orders
-                    WHERE id = %s
-                """
-                
-                cur.execute(select_query, (order_id,))
+                cur.execute(SELECT_ORDER_BY_ID_QUERY, (order_id,))
                 row = cur.fetchone()
                 
                 if not row:
@@ -227,3 +228,22 @@ def get_order_by_id(order_id: int) -> Optional[OrderResponse]:
             )
             raise
 
+
+def warm_up_connection(conn: connection) -> None:
+    """
+    Plan every repository query once on a freshly opened connection.
+    
+    EXPLAIN plans without executing, which loads the backend's catalog and
+    relation caches for the orders table and its indexes so the first real
+    request on this connection does not pay for it.
+    
+    Args:
+        conn: Pooled connection to warm
+        
+    Raises:
+        psycopg2.Error: If planning fails (e.g. schema missing)
+    """
+    with conn.cursor() as cur:
+        cur.execute("EXPLAIN " + INSERT_ORDER_QUERY, (1, 1, 1, "created"))
+        cur.execute("EXPLAIN " + SELECT_ORDER_BY_ID_QUERY, (1,))
+    conn.rollback()
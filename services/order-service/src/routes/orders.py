@@ -1,11 +1,23 @@
 """
 REST API routes for order operations.
 
-This module defines the HTTP endpoints for creating and retrieving orders.
+This module defines the HTTP endpoints for creating and retrieving orders,
+and for watching an order's status via Server-Sent Events or long-polling.
 """
-from fastapi import APIRouter, HTTPException, status
+import asyncio
+from contextlib import AsyncExitStack
+from typing import AsyncGenerator, Optional
 
-from src.models.order import OrderCreate, OrderResponse
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from src.config.settings import settings
+from src.models.order import OrderCreate, OrderResponse, OrderStatusEvent
+from src.services.order_events import (
+    OrderSubscription,
+    SubscriberLimitExceeded,
+    get_event_broker,
+)
 from src.services.order_service import create_order_service, get_order_service
 
 router = APIRouter(prefix="/api/v1/orders", tags=["orders"])
@@ -64,3 +76,127 @@ async def get_order_endpoint(id: int) -> OrderResponse:
             detail=f"Failed to retrieve order: {str(e)}"
         )
 
+
+@router.get("/{id}/events", response_model=None)
+async def order_events_endpoint(
+    id: int,
+    long_poll: bool = Query(False, description="Return a single JSON event instead of an SSE stream"),
+    known_status: Optional[str] = Query(
+        None,
+        alias="status",
+        description="Long-poll only: last status seen by the client; the request waits until it changes",
+    ),
+    timeout: Optional[float] = Query(
+        None,
+        gt=0,
+        description="Long-poll only: seconds to wait (capped at the configured maximum)",
+    ),
+) -> StreamingResponse | OrderStatusEvent:
+    """
+    Watch an order's status.
+    
+    By default this is a Server-Sent Events stream: the current status is
+    sent immediately as a `status` event, every later change as another
+    `status` event, and heartbeat comments keep idle connections open.
+    
+    With `long_poll=true` a single OrderStatusEvent is returned instead, as
+    soon as the order's status differs from `status` or when the timeout
+    elapses (in which case the unchanged current status is returned).
+    
+    Args:
+        id: The ID of the order to watch
+        long_poll: Use the long-poll fallback instead of SSE
+        known_status: Last status the long-polling client has seen
+        timeout: Long-poll wait in seconds
+        
+    Returns:
+        StreamingResponse (SSE) or OrderStatusEvent (long-poll)
+        
+    Raises:
+        HTTPException: 404 if order not found, 503 if the subscriber limit
+            is reached, 500 if the database is unavailable
+    """
+    stack = AsyncExitStack()
+    try:
+        # Subscribe before reading the current status so no change is missed
+        subscription = await stack.enter_async_context(get_event_broker().subscribe(id))
+        order = await asyncio.to_thread(get_order_service, id)
+    except SubscriberLimitExceeded as e:
+        await stack.aclose()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(settings.events_retry_after)},
+        )
+    except Exception as e:
+        await stack.aclose()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to subscribe to order events: {str(e)}"
+        )
+    
+    if order is None:
+        await stack.aclose()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Order with ID {id} not found"
+        )
+    
+    current = OrderStatusEvent(order_id=order.order_id, status=order.status)
+    
+    if long_poll:
+        async with stack:
+            wait = min(timeout or settings.events_long_poll_timeout, settings.events_long_poll_timeout)
+            return await _wait_for_status_change(subscription, current, known_status, wait)
+    
+    return StreamingResponse(
+        _sse_stream(stack, subscription, current),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _wait_for_status_change(
+    subscription: OrderSubscription,
+    current: OrderStatusEvent,
+    known_status: Optional[str],
+    wait: float,
+) -> OrderStatusEvent:
+    """Block until the status differs from known_status or wait seconds pass."""
+    if known_status is None or current.status != known_status:
+        return current
+    
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    while (remaining := deadline - loop.time()) > 0:
+        event = await subscription.get(timeout=remaining)
+        if event is None:
+            if subscription.closed:
+                break
+            continue
+        current = event
+        if current.status != known_status:
+            break
+    return current
+
+
+async def _sse_stream(
+    stack: AsyncExitStack,
+    subscription: OrderSubscription,
+    current: OrderStatusEvent,
+) -> AsyncGenerator[str, None]:
+    """Yield SSE frames until the subscription closes or the client goes away."""
+    async with stack:
+        yield _format_sse(current)
+        while True:
+            event = await subscription.get(timeout=settings.events_heartbeat_interval)
+            if event is not None:
+                yield _format_sse(event)
+            elif subscription.closed:
+                return
+            else:
+                yield ": heartbeat\n\n"
+
+
+def _format_sse(event: OrderStatusEvent) -> str:
+    return f"event: status\ndata: {event.model_dump_json()}\n\n"
@@ -0,0 +1,323 @@
+"""
+Order status event fan-out.
+
+Each worker process holds a single dedicated Postgres connection that
+LISTENs on the order status channel (see
+infra/db/init/002_order_status_notify.sql). Notifications are read on the
+event loop and fanned out in memory to per-order subscribers, which back the
+SSE and long-poll endpoints. This replaces client polling of
+GET /api/v1/orders/{id} with one shared connection per worker.
+"""
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Optional
+
+import psycopg2
+from psycopg2 import sql
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT, connection
+from pydantic import ValidationError
+
+from src.config.database import get_connection_string
+from src.config.settings import settings
+from src.models.order import OrderStatusEvent
+
+logger = logging.getLogger(__name__)
+
+# Marker queued to a subscription when its stream has been terminated
+_CLOSED = object()
+
+
+class SubscriberLimitExceeded(Exception):
+    """Raised when a worker already serves the maximum number of subscribers."""
+
+
+class OrderSubscription:
+    """
+    A single subscriber's buffered view of one order's status events.
+
+    Events are buffered in a bounded queue; what happens when it fills up is
+    decided by the broker's slow consumer policy.
+    """
+
+    def __init__(self, order_id: int, queue_size: int):
+        self.order_id = order_id
+        self.closed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    async def get(self, timeout: float) -> Optional[OrderStatusEvent]:
+        """
+        Wait for the next status event.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            OrderStatusEvent, or None on timeout or once the subscription
+            is closed (check `closed` to tell the two apart).
+        """
+        if self.closed and self._queue.empty():
+            return None
+        try:
+            item = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        if item is _CLOSED:
+            return None
+        return item
+
+    def _offer(self, event: OrderStatusEvent, drop_oldest: bool) -> bool:
+        """Queue an event without blocking; returns False if it did not fit."""
+        if self.closed:
+            # Never displace the close marker of a terminated subscription
+            return True
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            if not drop_oldest:
+                return False
+        self._queue.get_nowait()
+        self._queue.put_nowait(event)
+        return True
+
+    def _close(self) -> None:
+        """Terminate the subscription, discarding anything still buffered."""
+        self.closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(_CLOSED)
+
+
+class OrderEventBroker:
+    """
+    Fans order status notifications from one LISTEN connection out to subscribers.
+
+    The LISTEN connection is opened lazily on the first subscription. If it
+    is lost, every open subscription is closed so clients reconnect, and the
+    next subscription re-establishes the listener.
+    """
+
+    def __init__(
+        self,
+        channel: str = settings.events_channel,
+        max_subscribers: int = settings.events_max_subscribers,
+        queue_size: int = settings.events_queue_size,
+        slow_consumer_policy: str = settings.events_slow_consumer_policy,
+    ):
+        self.channel = channel
+        self.max_subscribers = max_subscribers
+        self.queue_size = queue_size
+        self.slow_consumer_policy = slow_consumer_policy
+
+        self._conn: connection | None = None
+        self._listener_fd: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._start_lock = asyncio.Lock()
+        self._subscribers: dict[int, set[OrderSubscription]] = {}
+        self._subscriber_count = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of currently open subscriptions."""
+        return self._subscriber_count
+
+    async def start(self) -> None:
+        """
+        Open the LISTEN connection and register it with the event loop.
+
+        Safe to call repeatedly; only the first call (or the first after a
+        lost connection) connects.
+
+        Raises:
+            psycopg2.Error: If the listener connection cannot be established
+        """
+        async with self._start_lock:
+            if self._conn is not None:
+                if self._loop is asyncio.get_running_loop():
+                    return
+                # The listener belongs to a different (e.g. finished) event loop
+                self._stop_listener()
+
+            conn = await asyncio.to_thread(
+                psycopg2.connect,
+                get_connection_string(),
+                connect_timeout=settings.db_connect_timeout,
+            )
+            try:
+                conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as cur:
+                    cur.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self.channel)))
+            except Exception:
+                conn.close()
+                raise
+
+            self._loop = asyncio.get_running_loop()
+            self._listener_fd = conn.fileno()
+            self._loop.add_reader(self._listener_fd, self._on_readable)
+            self._conn = conn
+
+            logger.info(
+                "Order event listener started",
+                extra={"service_name": "order-service", "channel": self.channel}
+            )
+
+    async def close(self) -> None:
+        """Stop listening and close every open subscription."""
+        self._stop_listener()
+        self._close_all_subscriptions()
+
+    @asynccontextmanager
+    async def subscribe(self, order_id: int) -> AsyncGenerator[OrderSubscription, None]:
+        """
+        Subscribe to status events for one order.
+
+        Usage:
+            async with broker.subscribe(order_id) as subscription:
+                event = await subscription.get(timeout=15)
+
+        Raises:
+            SubscriberLimitExceeded: If the worker is at max_subscribers
+            psycopg2.Error: If the listener connection cannot be established
+        """
+        if self._subscriber_count >= self.max_subscribers:
+            raise SubscriberLimitExceeded(
+                f"Subscriber limit of {self.max_subscribers} reached"
+            )
+
+        # Register (reserving the slot) before awaiting, so concurrent
+        # subscribers cannot all pass the limit check while the listener starts
+        subscription = self._register(order_id)
+        try:
+            await self.start()
+            yield subscription
+        finally:
+            self._unregister(subscription)
+
+    def _register(self, order_id: int) -> OrderSubscription:
+        subscription = OrderSubscription(order_id, self.queue_size)
+        self._subscribers.setdefault(order_id, set()).add(subscription)
+        self._subscriber_count += 1
+        return subscription
+
+    def _unregister(self, subscription: OrderSubscription) -> None:
+        subscriptions = self._subscribers.get(subscription.order_id)
+        if subscriptions is None or subscription not in subscriptions:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscribers[subscription.order_id]
+        self._subscriber_count -= 1
+
+    def _on_readable(self) -> None:
+        """Event loop callback: drain pending notifications from the listener."""
+        conn = self._conn
+        if conn is None:
+            return
+
+        try:
+            conn.poll()
+        except psycopg2.Error as e:
+            logger.error(
+                f"Order event listener connection lost: {e}",
+                extra={"service_name": "order-service", "channel": self.channel},
+                exc_info=True
+            )
+            self._stop_listener()
+            self._close_all_subscriptions()
+            return
+
+        while conn.notifies:
+            notify = conn.notifies.pop(0)
+            self._dispatch(notify.payload)
+
+    def _dispatch(self, payload: str) -> None:
+        """Deliver one notification payload to the order's subscribers."""
+        try:
+            event = OrderStatusEvent.model_validate_json(payload)
+        except ValidationError as e:
+            logger.warning(
+                f"Ignoring malformed order status notification: {e}",
+                extra={"service_name": "order-service", "payload": payload}
+            )
+            return
+
+        drop_oldest = self.slow_consumer_policy == "drop_oldest"
+        for subscription in list(self._subscribers.get(event.order_id, ())):
+            if subscription._offer(event, drop_oldest):
+                continue
+
+            logger.warning(
+                "Disconnecting slow order event subscriber",
+                extra={"service_name": "order-service", "order_id": event.order_id}
+            )
+            subscription._close()
+            self._unregister(subscription)
+
+    def _close_all_subscriptions(self) -> None:
+        for subscriptions in list(self._subscribers.values()):
+            for subscription in list(subscriptions):
+                subscription._close()
+                self._unregister(subscription)
+
+    def _stop_listener(self) -> None:
+        if self._conn is None:
+            return
+
+        conn, self._conn = self._conn, None
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(self._listener_fd)
+        self._listener_fd = None
+        conn.close()
+
+        logger.info(
+            "Order event listener stopped",
+            extra={"service_name": "order-service", "channel": self.channel}
+        )
+
+
+# Global broker instance (one per worker process)
+_event_broker: OrderEventBroker | None = None
+
+# Brokers inherited from a parent process, kept alive so their LISTEN
+# connection is never closed (or garbage-collected) in the child
+_inherited_brokers: list[OrderEventBroker] = []
+
+
+def get_event_broker() -> OrderEventBroker:
+    """
+    Get or create the worker's order event broker.
+
+    Returns:
+        OrderEventBroker: The shared broker instance.
+    """
+    global _event_broker
+
+    if _event_broker is None:
+        _event_broker = OrderEventBroker()
+
+    return _event_broker
+
+
+async def close_event_broker() -> None:
+    """
+    Close the event broker and its LISTEN connection.
+    Should be called during application shutdown.
+    """
+    global _event_broker
+
+    if _event_broker:
+        await _event_broker.close()
+        _event_broker = None
+
+
+def _discard_event_broker_after_fork():
+    """Set aside a broker (and its LISTEN connection) inherited from the parent process."""
+    global _event_broker
+    if _event_broker is not None:
+        _inherited_brokers.append(_event_broker)
+    _event_broker = None
+
+
+os.register_at_fork(after_in_child=_discard_event_broker_after_fork)
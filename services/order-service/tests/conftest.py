@@ -0,0 +1,59 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import httpx
+import pytest
+
+SERVICE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def uvicorn_server(env: dict | None = None) -> Iterator[str]:
+    """Run the app in a real uvicorn process and yield its base URL."""
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=SERVICE_ROOT,
+        env=dict(os.environ, **(env or {})),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def wait_until_ready(url: str, timeout: float) -> bool:
+    """Poll /ready until it returns 200; False if it does not within `timeout` seconds."""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if httpx.get(f"{url}/ready", timeout=1).status_code == 200:
+                return True
+        except httpx.TransportError:
+            pass
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture(scope="module")
+def live_server():
+    """Real uvicorn server (TestClient buffers whole responses, so it cannot read SSE)."""
+    # Short heartbeat so SSE tests see one without waiting
+    with uvicorn_server({"ORDER_EVENTS_HEARTBEAT_INTERVAL": "0.2"}) as url:
+        if not wait_until_ready(url, timeout=10):
+            pytest.fail(f"Live server at {url} did not become ready within 10s")
+        yield url
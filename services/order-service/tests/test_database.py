@@ -0,0 +1,70 @@
+import gc
+import os
+import runpy
+from types import SimpleNamespace
+
+import pytest
+from src.config import database
+from src.config.settings import settings
+from tests.conftest import SERVICE_ROOT
+
+
+def test_pool_size_splits_budget_across_workers(monkeypatch):
+    monkeypatch.setattr(settings, "db_connection_budget", 90)
+    monkeypatch.setattr(settings, "db_pool_min_size", 1)
+
+    # Shares are halved so old and new workers fit during a reload
+    assert database.get_pool_size(1) == (1, 44)
+    assert database.get_pool_size(4) == (1, 10)
+
+
+def test_pool_size_min_capped_at_max(monkeypatch):
+    monkeypatch.setattr(settings, "db_connection_budget", 18)
+    monkeypatch.setattr(settings, "db_pool_min_size", 5)
+
+    assert database.get_pool_size(3) == (2, 2)
+
+
+def test_pool_size_rejects_insufficient_budget(monkeypatch):
+    monkeypatch.setattr(settings, "db_connection_budget", 11)
+
+    with pytest.raises(ValueError):
+        database.get_pool_size(3)
+
+
+def test_pool_set_aside_after_fork(monkeypatch):
+    inherited = object()
+    monkeypatch.setattr(database, "_db_pool", inherited)
+    monkeypatch.setattr(database, "_inherited_pools", [])
+
+    database._discard_db_pool_after_fork()
+
+    assert database._db_pool is None
+    assert database._inherited_pools == [inherited]
+
+
+def test_gunicorn_worker_count_reaches_workers(monkeypatch):
+    config = runpy.run_path(os.path.join(SERVICE_ROOT, "gunicorn.conf.py"))
+    monkeypatch.setattr(settings, "web_workers", 1)
+
+    config["pre_fork"](SimpleNamespace(cfg=SimpleNamespace(workers=8)), None)
+
+    assert settings.web_workers == 8
+
+
+def test_forked_child_leaves_parent_connections_open():
+    database.get_db_pool()
+    database.ping_database()
+
+    pid = os.fork()
+    if pid == 0:
+        # Child: the fork hook has set the parent's pool aside, so the
+        # child's own shutdown must leave the parent's sessions alone
+        status = 0 if database._db_pool is None else 1
+        database.close_db_pool()
+        gc.collect()
+        os._exit(status)
+    _, status = os.waitpid(pid, 0)
+
+    assert os.waitstatus_to_exitcode(status) == 0
+    database.ping_database()
@@ -0,0 +1,236 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from src.config.database import get_connection
+from src.config.settings import settings
+from src.main import app
+from src.services.order_events import (
+    OrderEventBroker,
+    SubscriberLimitExceeded,
+    get_event_broker,
+)
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def live_client():
+    """Client whose event loop (and LISTEN connection) lives across requests."""
+    with TestClient(app) as client:
+        yield client
+
+
+def _create_order(client, user_id):
+    response = client.post("/api/v1/orders", json={"user_id": user_id, "product_id": 1, "quantity": 1})
+    assert response.status_code == 201
+    return response.json()["order_id"]
+
+
+def _set_status(order_id, status):
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("UPDATE orders SET status = %s WHERE id = %s", (status, order_id))
+        conn.commit()
+
+
+def _payload(order_id, status):
+    return f'{{"order_id": {order_id}, "status": "{status}"}}'
+
+
+def test_broker_fans_out_to_order_subscribers():
+    async def scenario():
+        broker = OrderEventBroker(max_subscribers=10, queue_size=4)
+        first = broker._register(1)
+        second = broker._register(1)
+        other = broker._register(2)
+
+        broker._dispatch(_payload(1, "paid"))
+
+        assert (await first.get(timeout=0.1)).status == "paid"
+        assert (await second.get(timeout=0.1)).status == "paid"
+        assert await other.get(timeout=0.01) is None
+
+    asyncio.run(scenario())
+
+
+def test_broker_ignores_malformed_payload():
+    async def scenario():
+        broker = OrderEventBroker()
+        subscription = broker._register(1)
+
+        broker._dispatch("not json")
+
+        assert await subscription.get(timeout=0.01) is None
+        assert not subscription.closed
+
+    asyncio.run(scenario())
+
+
+def test_slow_consumer_drop_oldest():
+    async def scenario():
+        broker = OrderEventBroker(queue_size=2, slow_consumer_policy="drop_oldest")
+        subscription = broker._register(1)
+
+        for status in ("paid", "shipped", "delivered"):
+            broker._dispatch(_payload(1, status))
+
+        assert (await subscription.get(timeout=0.1)).status == "shipped"
+        assert (await subscription.get(timeout=0.1)).status == "delivered"
+        assert broker.subscriber_count == 1
+
+    asyncio.run(scenario())
+
+
+def test_slow_consumer_disconnect():
+    async def scenario():
+        broker = OrderEventBroker(queue_size=1, slow_consumer_policy="disconnect")
+        subscription = broker._register(1)
+
+        broker._dispatch(_payload(1, "paid"))
+        broker._dispatch(_payload(1, "shipped"))
+
+        assert await subscription.get(timeout=0.1) is None
+        assert subscription.closed
+        assert broker.subscriber_count == 0
+
+    asyncio.run(scenario())
+
+
+def test_order_events_long_poll_returns_changed_status(client):
+    order_data = {"user_id": 4, "product_id": 400, "quantity": 1}
+    create_response = client.post("/api/v1/orders", json=order_data)
+    assert create_response.status_code == 201
+    order_id = create_response.json()["order_id"]
+
+    response = client.get(
+        f"/api/v1/orders/{order_id}/events",
+        params={"long_poll": "true", "status": "unknown"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"order_id": order_id, "status": "created"}
+
+
+def test_order_events_long_poll_times_out_unchanged(client):
+    order_data = {"user_id": 5, "product_id": 500, "quantity": 1}
+    create_response = client.post("/api/v1/orders", json=order_data)
+    order_id = create_response.json()["order_id"]
+
+    response = client.get(
+        f"/api/v1/orders/{order_id}/events",
+        params={"long_poll": "true", "status": "created", "timeout": 0.2},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"order_id": order_id, "status": "created"}
+
+
+def test_order_events_not_found(client):
+    response = client.get("/api/v1/orders/99999/events", params={"long_poll": "true"})
+
+    assert response.status_code == 404
+
+
+def test_order_events_subscriber_limit_sets_retry_after(client, monkeypatch):
+    order_id = _create_order(client, 8)
+    monkeypatch.setattr(get_event_broker(), "max_subscribers", 0)
+
+    response = client.get(f"/api/v1/orders/{order_id}/events", params={"long_poll": "true"})
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(settings.events_retry_after)
+
+
+def test_subscriber_limit_holds_during_listener_start(monkeypatch):
+    async def slow_start():
+        await asyncio.sleep(0.01)
+
+    async def scenario():
+        broker = OrderEventBroker(max_subscribers=2)
+        monkeypatch.setattr(broker, "start", slow_start)
+        admitted = []
+
+        async def subscriber(order_id):
+            try:
+                async with broker.subscribe(order_id):
+                    admitted.append(order_id)
+                    await asyncio.sleep(0.05)
+            except SubscriberLimitExceeded:
+                pass
+
+        await asyncio.gather(*(subscriber(order_id) for order_id in range(5)))
+        assert len(admitted) == 2
+        assert broker.subscriber_count == 0
+
+    asyncio.run(scenario())
+
+
+def test_closed_subscription_not_reopened_by_dispatch():
+    async def scenario():
+        broker = OrderEventBroker(queue_size=1, slow_consumer_policy="drop_oldest")
+        subscription = broker._register(1)
+
+        broker._close_all_subscriptions()
+        broker._dispatch(_payload(1, "paid"))
+
+        assert await subscription.get(timeout=0.1) is None
+        assert subscription.closed
+        assert broker.subscriber_count == 0
+
+    asyncio.run(scenario())
+
+
+def test_order_events_long_poll_wakes_on_status_change(live_client):
+    order_id = _create_order(live_client, 6)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        started = time.monotonic()
+        pending = executor.submit(
+            live_client.get,
+            f"/api/v1/orders/{order_id}/events",
+            params={"long_poll": "true", "status": "created", "timeout": 10},
+        )
+        # Wait for the long-poll to subscribe before changing the status
+        deadline = time.monotonic() + 5
+        while get_event_broker().subscriber_count < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        _set_status(order_id, "paid")
+        response = pending.result(timeout=10)
+
+    assert response.status_code == 200
+    assert response.json() == {"order_id": order_id, "status": "paid"}
+    assert time.monotonic() - started < 5
+
+
+def test_order_events_sse_stream(live_server):
+    with httpx.Client(base_url=live_server) as http:
+        order_id = _create_order(http, 7)
+
+        with http.stream("GET", f"/api/v1/orders/{order_id}/events") as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+            lines = response.iter_lines()
+
+            assert next(lines) == "event: status"
+            assert json.loads(next(lines).removeprefix("data: ")) == {"order_id": order_id, "status": "created"}
+            assert next(lines) == ""
+            assert next(lines) == ": heartbeat"
+            assert next(lines) == ""
+
+            _set_status(order_id, "shipped")
+            frames = []
+            for line in lines:
+                frames.append(line)
+                if line.startswith("data: "):
+                    break
+
+    assert "event: status" in frames
+    assert json.loads(frames[-1].removeprefix("data: ")) == {"order_id": order_id, "status": "shipped"}
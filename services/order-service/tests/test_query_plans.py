@@ -0,0 +1,100 @@
+import random
+from collections import Counter
+from datetime import datetime
+
+from scripts.check_query_plans import (
+    QUERY_CHECKS,
+    PlanSample,
+    capture_plan,
+    collect_scans,
+    find_regressions,
+)
+from scripts.seed_orders import connect, count_orders, generate_orders, seed_orders
+
+
+def test_generate_orders_is_skewed_and_reproducible():
+    now = datetime(2025, 1, 1)
+    rows = list(generate_orders(5000, random.Random(1), users=1000, products=100, days=30, now=now))
+
+    assert rows == list(generate_orders(5000, random.Random(1), users=1000, products=100, days=30, now=now))
+    assert all(1 <= user_id <= 1000 and 1 <= product_id <= 100 for user_id, product_id, *_ in rows)
+    assert all(1 <= quantity <= 20 for _, _, quantity, _, _ in rows)
+
+    # The busiest 10% of users place well over 10% of the orders
+    by_user = Counter(user_id for user_id, *_ in rows)
+    top_users = sum(count for _, count in by_user.most_common(100))
+    assert top_users > 0.3 * len(rows)
+
+
+def test_collect_scans_walks_plan_tree():
+    plan = {
+        "Node Type": "Nested Loop",
+        "Plans": [
+            {"Node Type": "Index Scan", "Relation Name": "orders", "Index Name": "orders_pkey"},
+            {"Node Type": "ModifyTable", "Relation Name": "orders", "Plans": [
+                {"Node Type": "Seq Scan", "Relation Name": "users"},
+            ]},
+        ],
+    }
+
+    assert collect_scans(plan) == {("Index Scan", "orders"), ("Seq Scan", "users")}
+
+
+def _sample(rows, scans, buffers):
+    return PlanSample(query="get_order_by_id", rows=rows, scans=set(scans), buffers=buffers)
+
+
+def test_find_regressions_flags_index_to_seq_scan():
+    regressions = find_regressions(
+        [
+            [_sample(10_000, [("Index Scan", "orders")], 3)],
+            [_sample(1_000_000, [("Seq Scan", "orders")], 3)],
+        ],
+        max_buffer_growth=2.0,
+    )
+
+    assert len(regressions) == 1
+    assert "sequential scan" in regressions[0]
+
+
+def test_find_regressions_flags_buffer_growth():
+    regressions = find_regressions(
+        [
+            [_sample(10_000, [("Index Scan", "orders")], 3)],
+            [_sample(100_000, [("Index Scan", "orders")], 5)],
+            [_sample(1_000_000, [("Index Scan", "orders")], 7)],
+        ],
+        max_buffer_growth=2.0,
+    )
+
+    assert len(regressions) == 1
+    assert "1000000 rows" in regressions[0]
+
+
+def test_seed_orders_copies_rows():
+    conn = connect()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT count(*) FROM orders")
+            before = cur.fetchone()[0]
+
+            # Seed inside one transaction that is rolled back, leaving the table untouched
+            seed_orders(conn, 200, random.Random(0), users=50, products=10, days=7, batch_size=150, commit=False)
+
+            cur.execute("SELECT count(*) FROM orders")
+            assert cur.fetchone()[0] == before + 200
+    finally:
+        conn.rollback()
+        conn.close()
+
+
+def test_capture_plans():
+    conn = connect()
+    try:
+        rows = count_orders(conn)
+        for check in QUERY_CHECKS:
+            sample = capture_plan(conn, check, random.Random(0), rows, samples=2)
+            assert sample.buffers > 0
+            assert sample.plan["Plan"]
+    finally:
+        conn.close()
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+import psycopg2
+from psycopg2.pool import PoolError
+from src import main
+from src.config.database import get_db_pool
+from src.config.settings import settings
+from src.services.order_events import OrderEventBroker
+from tests.conftest import uvicorn_server, wait_until_ready
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as client:
+        yield client
+
+
+def test_ready_endpoint(client):
+    response = client.get("/ready")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ready"
+    assert data["pool"]["initialized"] is True
+    assert data["pool"]["idle"] >= 1
+
+
+def test_ready_reports_unreachable_database(client, monkeypatch):
+    def unreachable():
+        raise ConnectionError("database unreachable")
+
+    monkeypatch.setattr(main, "ping_database", unreachable)
+
+    response = client.get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "unavailable"
+    assert client.get("/health").status_code == 200
+
+
+def test_ready_with_exhausted_pool(client, caplog):
+    pool_instance = get_db_pool()
+    checked_out = []
+    try:
+        while True:
+            checked_out.append(pool_instance.getconn())
+    except PoolError:
+        pass
+
+    try:
+        with caplog.at_level(logging.ERROR):
+            response = client.get("/ready")
+    finally:
+        for conn in checked_out:
+            pool_instance.putconn(conn)
+
+    assert response.status_code == 200
+    assert response.json()["pool"]["in_use"] == response.json()["pool"]["max"]
+    assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
+
+
+def test_cold_start_latency():
+    """Process exec to first successful /ready must stay within the startup budget."""
+    started = time.perf_counter()
+    with uvicorn_server() as url:
+        ready = wait_until_ready(url, settings.startup_budget_seconds - (time.perf_counter() - started))
+
+    assert ready, f"service not ready within {settings.startup_budget_seconds}s budget"
+
+
+def test_event_listener_connect_times_out(monkeypatch):
+    """A database that accepts TCP but never answers must not hang startup."""
+    with socket.socket() as silent:
+        silent.bind(("127.0.0.1", 0))
+        silent.listen()
+        monkeypatch.setattr(settings, "db_host", "127.0.0.1")
+        monkeypatch.setattr(settings, "db_port", silent.getsockname()[1])
+        monkeypatch.setattr(settings, "db_connect_timeout", 1)
+
+        started = time.perf_counter()
+        with pytest.raises(psycopg2.OperationalError):
+            asyncio.run(OrderEventBroker().start())
+
+    assert time.perf_counter() - started < 5
+
+
+def test_forked_worker_times_startup_from_fork():
+    """A worker forked from a preloaded master must not inherit the master's start time."""
+    pid = os.fork()
+    if pid == 0:
+        reset = main._preloaded and main._process_started > main._import_started
+        os._exit(0 if reset else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert not main._preloaded